@@ -1,13 +1,23 @@
 import yaml
-from flask import Flask, request, send_from_directory, jsonify, abort, render_template_string
+from flask import Flask, request, send_from_directory, jsonify, abort, Response
 import os
 import json
+import sqlite3
+import threading
+from contextlib import closing
+from collections import deque
+from html import escape
 
 app = Flask(__name__)
 
 # Configuration
 UPLOAD_FOLDER = 'boards'
 ALLOWED_EXTENSIONS = {'json'}
+STORAGE_ENGINE = 'json'  # 'json' or 'sqlite'
+DATABASE = os.path.join(UPLOAD_FOLDER, 'kapyban.db')
+TASK_FIELDS = ('id', 'description', 'timestamp', 'priority', 'deadline')
+EVENT_HISTORY = 100  # Change events kept per board for reconnecting clients
+KEEPALIVE_INTERVAL = 15  # Seconds between keep-alive comments on idle event streams
 
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
@@ -23,9 +33,268 @@ except FileNotFoundError:
 except yaml.YAMLError as e:
     raise Exception(f"Error reading passwords.yaml: {e}")
 
+class JsonStorage:
+    """
+    Default storage engine. Every board is a single JSON file in UPLOAD_FOLDER.
+    """
+    def path(self, filename):
+        return os.path.join(UPLOAD_FOLDER, filename + '.json')
+
+    def save(self, filename, content):
+        with open(self.path(filename), 'w') as file:
+            json.dump(content, file, indent=4)
+
+    def load(self, filename):
+        # Returns the columns of the board, or None if it does not exist
+        try:
+            with open(self.path(filename), 'r') as file:
+                return json.load(file).get('data', {})
+        except FileNotFoundError:
+            return None
+
+    def download(self, filename):
+        return send_from_directory(UPLOAD_FOLDER, filename + '.json', as_attachment=True)
+
+    def render(self, filename):
+        try:
+            with open(self.path(filename), 'r') as file:
+                return json.load(file).get('board_visual', '')
+        except FileNotFoundError:
+            return None
+
+def stable_positions(tasks, stored):
+    """
+    Positions to store for the tasks of one column. stored maps the ids of
+    tasks already saved in this column to their stored position. Those are
+    kept while the column keeps its order and new tasks are appended after
+    them, so positions are only renumbered when the column is reordered.
+    """
+    positions = []
+    last = -1
+    last_stored = max((i for i, task in enumerate(tasks) if task['id'] in stored), default=-1)
+    for i, task in enumerate(tasks):
+        position = stored.get(task['id'])
+        if position is None and i > last_stored:
+            position = last + 1  # Appended after every task already stored
+        if position is None or position <= last:
+            return list(range(len(tasks)))
+        positions.append(position)
+        last = position
+    return positions
+
+class SqliteStorage:
+    """
+    SQLite storage engine. Tasks of all boards live in one indexed table, so an
+    upload only writes the rows that changed and views are rendered from queries.
+    """
+    def __init__(self, database):
+        self.database = database
+        self.lock = threading.Lock()
+        with closing(self.connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS boards (
+                    board TEXT PRIMARY KEY
+                );
+                CREATE TABLE IF NOT EXISTS columns (
+                    board TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    PRIMARY KEY (board, name)
+                );
+                CREATE TABLE IF NOT EXISTS tasks (
+                    board TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    column_name TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    description TEXT,
+                    timestamp TEXT,
+                    priority TEXT,
+                    deadline TEXT,
+                    PRIMARY KEY (board, id)
+                );
+                CREATE INDEX IF NOT EXISTS tasks_column ON tasks (board, column_name, position);
+                CREATE INDEX IF NOT EXISTS tasks_deadline ON tasks (board, deadline);
+            """)
+
+    def connect(self):
+        return sqlite3.connect(self.database)
+
+    def task_row(self, filename, column_name, position, task):
+        return (filename, task['id'], column_name, position) + tuple(task.get(field) for field in TASK_FIELDS[1:])
+
+    def save(self, filename, content):
+        columns = content.get('data', {})
+
+        with self.lock, closing(self.connect()) as connection, connection:
+            existing = {row[1]: row for row in connection.execute(
+                "SELECT board, id, column_name, position, description, timestamp, priority, deadline FROM tasks WHERE board = ?",
+                (filename,))}
+            column_names = [name for (name,) in connection.execute(
+                "SELECT name FROM columns WHERE board = ? ORDER BY position", (filename,))]
+
+            rows = {}
+            for column_name, tasks in columns.items():
+                stored = {row[1]: row[3] for row in (existing.get(task['id']) for task in tasks)
+                          if row is not None and row[2] == column_name}
+                for position, task in zip(stable_positions(tasks, stored), tasks):
+                    rows[task['id']] = self.task_row(filename, column_name, position, task)
+
+            # Only write the rows that changed since the last upload
+            changed = [row for task_id, row in rows.items() if existing.get(task_id) != row]
+            removed = [(filename, task_id) for task_id in existing if task_id not in rows]
+
+            connection.execute("INSERT OR IGNORE INTO boards (board) VALUES (?)", (filename,))
+            if column_names != list(columns.keys()):
+                connection.execute("DELETE FROM columns WHERE board = ?", (filename,))
+                connection.executemany("INSERT INTO columns (board, name, position) VALUES (?, ?, ?)",
+                                       [(filename, name, position) for position, name in enumerate(columns.keys())])
+            if removed:
+                connection.executemany("DELETE FROM tasks WHERE board = ? AND id = ?", removed)
+            if changed:
+                connection.executemany("INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)", changed)
+
+    def load(self, filename):
+        # Returns the columns of the board, or None if it does not exist
+        with closing(self.connect()) as connection:
+            columns = {name: [] for (name,) in connection.execute(
+                "SELECT name FROM columns WHERE board = ? ORDER BY position", (filename,))}
+            # A board uploaded without columns still exists
+            if not columns and connection.execute("SELECT 1 FROM boards WHERE board = ?", (filename,)).fetchone() is None:
+                return None
+            for row in connection.execute(
+                    "SELECT id, column_name, description, timestamp, priority, deadline FROM tasks "
+                    "WHERE board = ? ORDER BY column_name, position", (filename,)):
+                task = {field: value for field, value in zip(TASK_FIELDS, row[:1] + row[2:]) if value is not None}
+                columns.setdefault(row[1], []).append(task)
+        return columns
+
+    def download(self, filename):
+        columns = self.load(filename)
+        if columns is None:
+            abort(404)
+        return Response(json.dumps({'data': columns}, indent=4), mimetype='application/json',
+                        headers={'Content-Disposition': f'attachment; filename={filename}.json'})
+
+    def render(self, filename):
+        columns = self.load(filename)
+        if columns is None:
+            return None
+        return generate_html_table(filename, columns)
+
+def generate_html_table(filename, columns):
+    headers = list(columns.keys())
+    max_tasks = max((len(tasks) for tasks in columns.values()), default=0)
+
+    html_table = "<h1>" + escape(filename) + "</h1>"
+    html_table += "<table border='1'><tr>"
+    for header in headers:
+        html_table += f"<th>{escape(header)}</th>"
+    html_table += "</tr>"
+
+    for i in range(max_tasks):
+        html_table += "<tr>"
+        for column in headers:
+            tasks = columns[column]
+            if i < len(tasks):
+                task_str = "<br>".join([f"{key}: {escape(str(value))}".replace('\n', '<br>') for key, value in tasks[i].items()])
+                html_table += f"<td>{task_str}</td>"
+            else:
+                html_table += "<td></td>"
+        html_table += "</tr>"
+
+    html_table += "</table>"
+    return html_table
+
+storage = SqliteStorage(DATABASE) if STORAGE_ENGINE == 'sqlite' else JsonStorage()
+
+def board_operations(old_columns, new_columns):
+    """
+    Lists the operations that turn old_columns into new_columns: a 'columns'
+    operation when the column names or their order changed, a 'remove' per
+    deleted task, a 'task' per added, edited or moved task and an 'order'
+    per column whose tasks were reordered.
+    """
+    operations = []
+    if list(old_columns.keys()) != list(new_columns.keys()):
+        operations.append({'op': 'columns', 'columns': list(new_columns.keys())})
+
+    old_tasks = {}
+    for column_name, tasks in old_columns.items():
+        for task in tasks:
+            old_tasks[task['id']] = (column_name, task)
+
+    new_ids = set()
+    task_operations = []
+    order_operations = []
+    for column_name, tasks in new_columns.items():
+        ids = [task['id'] for task in tasks]
+        new_ids.update(ids)
+        for task in tasks:
+            if old_tasks.get(task['id']) != (column_name, task):
+                task_operations.append({'op': 'task', 'column': column_name, 'task': task})
+        if ids != [task['id'] for task in old_columns.get(column_name, [])]:
+            order_operations.append({'op': 'order', 'column': column_name, 'ids': ids})
+
+    operations += [{'op': 'remove', 'id': task_id} for task_id in old_tasks if task_id not in new_ids]
+    return operations + task_operations + order_operations
+
+class BoardEvents:
+    """
+    Keeps a version number and a short history of change events per board,
+    and wakes up the event streams waiting on them.
+    """
+    def __init__(self, history=EVENT_HISTORY):
+        self.history = history
+        self.condition = threading.Condition()
+        self.versions = {}
+        self.logs = {}
+
+    def publish(self, filename, operations, origin=None):
+        with self.condition:
+            version = self.versions.get(filename, 0) + 1
+            self.versions[filename] = version
+            change = {'operations': operations, 'origin': origin}
+            self.logs.setdefault(filename, deque(maxlen=self.history)).append((version, change))
+            self.condition.notify_all()
+            return version
+
+    def version(self, filename):
+        with self.condition:
+            return self.versions.get(filename, 0)
+
+    def since(self, filename, version):
+        """
+        Returns the events after version, or None if they are no longer
+        in the history and the client needs a full snapshot instead.
+        """
+        log = self.logs.get(filename, ())
+        current = self.versions.get(filename, 0)
+        if version > current or (version < current and (not log or log[0][0] > version + 1)):
+            return None
+        return [event for event in log if event[0] > version]
+
+    def wait(self, filename, version, timeout):
+        with self.condition:
+            self.condition.wait_for(lambda: self.versions.get(filename, 0) != version, timeout)
+            return self.versions.get(filename, 0)
+
+events = BoardEvents()
+upload_lock = threading.Lock()
+
+def format_event(event, version, data):
+    return f"id: {version}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def valid_board(content):
+    # An uploaded board is an object whose 'data' maps column names to lists of tasks
+    if not isinstance(content, dict) or not isinstance(content.get('data', {}), dict):
+        return False
+    return all(isinstance(tasks, list) and all(isinstance(task, dict) and 'id' in task for task in tasks)
+               for tasks in content.get('data', {}).values())
+
 def validate_password(filename, password):
     file_password = FILE_PASSWORDS.get(filename, FALLBACK_PASSWORD)
     return password == file_password
@@ -44,33 +313,88 @@ def upload_file(filename):
     if not validate_password(filename, password):
         return jsonify(error="Invalid password"), 403
 
-    file.save(os.path.join(UPLOAD_FOLDER, filename + '.json'))
-    return jsonify(success=True)
+    try:
+        content = json.load(file)
+    except ValueError:
+        return jsonify(error="Invalid file"), 400
+    if not valid_board(content):
+        return jsonify(error="Invalid board"), 400
+
+    # Clients that follow the event stream send the version their board is based on
+    base_version = request.form.get('base_version')
+    if base_version is not None and not base_version.isdigit():
+        return jsonify(error="Invalid version"), 400
+
+    with upload_lock:
+        old_columns = storage.load(filename) or {}
+        version = events.version(filename)
+        if base_version is not None and int(base_version) != version:
+            # Someone else changed the board first: send it back for the client to merge
+            return jsonify(error="Board changed on the server", version=version, data=old_columns), 409
+        storage.save(filename, content)
+        operations = board_operations(old_columns, content.get('data', {}))
+        if operations:
+            version = events.publish(filename, operations, request.form.get('origin'))
+    return jsonify(success=True, version=version)
 
 @app.route('/download/<filename>', methods=['GET'])
 def download_file(filename):
-    return send_from_directory(UPLOAD_FOLDER, filename + '.json', as_attachment=True)
+    return storage.download(filename)
+
+@app.route('/events/<filename>', methods=['GET'])
+def board_events(filename):
+    since = request.headers.get('Last-Event-ID', request.args.get('since'))
+    try:
+        since = int(since) if since is not None else None
+    except ValueError:
+        return jsonify(error="Invalid version"), 400
+
+    def stream(version):
+        with events.condition:
+            pending = events.since(filename, version) if version is not None else None
+            current = events.versions.get(filename, 0)
+        if pending is None:
+            # New or out-of-date subscriber: start from the whole board
+            yield format_event('snapshot', current, {'data': storage.load(filename) or {}})
+            pending = []
+        for version, change in pending:
+            yield format_event('change', version, change)
+        version = max([current] + [event[0] for event in pending])
+
+        while True:
+            if events.wait(filename, version, KEEPALIVE_INTERVAL) == version:
+                yield ": keep-alive\n\n"
+                continue
+            with events.condition:
+                pending = events.since(filename, version)
+            if pending is None:
+                version = events.version(filename)
+                yield format_event('snapshot', version, {'data': storage.load(filename) or {}})
+                continue
+            for version, change in pending:
+                yield format_event('change', version, change)
+
+    return Response(stream(since), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/<filename>', methods=['GET'])
 def view_file(filename):
-    try:
-        with open(os.path.join(UPLOAD_FOLDER, filename + '.json'), 'r') as file:
-            content = json.load(file)
-            visual_body = content.get('board_visual', '')
-            html_template = f'''
-                <!doctype html>
-                <html>
-                <head>
-                    <title>Kapyban Kanban Board</title>
-                </head>
-                <body>
-                    {visual_body}
-                </body>
-                </html>
-            '''
-            return render_template_string(html_template)
-    except FileNotFoundError:
+    visual_body = storage.render(filename)
+    if visual_body is None:
         abort(404)
+    html_template = f'''
+        <!doctype html>
+        <html>
+        <head>
+            <title>Kapyban Kanban Board</title>
+        </head>
+        <body>
+            {visual_body}
+        </body>
+        </html>
+    '''
+    # Served as-is: board contents must not be evaluated as a template
+    return Response(html_template, mimetype='text/html')
 
 @app.errorhandler(404)
 def not_found(error):
@@ -17,16 +17,245 @@ from rich.panel import Panel
 from rich.prompt import Prompt
 import aiohttp
 import asyncio
+import sqlite3
+import copy
+import uuid
+
+TASK_FIELDS = ('id', 'description', 'timestamp', 'priority', 'deadline')
+
+class JsonStorage:
+    """
+    Default storage engine. Keeps the whole board in a single JSON file.
+    """
+    extensions = ('.json',)
+
+    def __init__(self, filename):
+        self.filename = self.path(filename)
+
+    @classmethod
+    def path(cls, filename):
+        if not filename.lower().endswith('.json'):
+            filename += '.json'
+        return filename
+
+    def load(self):
+        # Returns the columns of the board, or None if the file does not exist
+        try:
+            with open(self.filename, 'r') as file:
+                loaded_data = json.load(file)
+                return loaded_data.get("data", {})  # Default to empty dict if "data" key is not found
+        except FileNotFoundError:
+            return None
+
+    def save(self, kanban):
+        with open(self.filename, 'w') as file:
+            file.write(kanban.to_json_string())
+
+def stable_positions(tasks, stored):
+    """
+    Positions to store for the tasks of one column. stored maps the ids of
+    tasks already saved in this column to their stored position. Those are
+    kept while the column keeps its order and new tasks are appended after
+    them, so positions are only renumbered when the column is reordered.
+    """
+    positions = []
+    last = -1
+    last_stored = max((i for i, task in enumerate(tasks) if task['id'] in stored), default=-1)
+    for i, task in enumerate(tasks):
+        position = stored.get(task['id'])
+        if position is None and i > last_stored:
+            position = last + 1  # Appended after every task already stored
+        if position is None or position <= last:
+            return list(range(len(tasks)))
+        positions.append(position)
+        last = position
+    return positions
+
+class SqliteStorage:
+    """
+    SQLite storage engine. Every task is a row in the tasks table, so saving
+    after a single-task mutation only writes that one row.
+    """
+    extensions = ('.db', '.sqlite', '.sqlite3')
+
+    def __init__(self, filename):
+        self.filename = self.path(filename)
+        self.connection = sqlite3.connect(self.filename)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS columns (
+                name TEXT PRIMARY KEY,
+                position INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                column_name TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                description TEXT,
+                timestamp TEXT,
+                priority TEXT,
+                deadline TEXT
+            );
+            CREATE INDEX IF NOT EXISTS tasks_column ON tasks (column_name, position);
+            CREATE INDEX IF NOT EXISTS tasks_deadline ON tasks (deadline);
+        """)
+        self.column_names = []  # Column names as last written to the database
+        self.rows = {}  # Task rows as last written to the database, keyed by id
+        self.load()
+
+    @classmethod
+    def path(cls, filename):
+        return filename
+
+    def task_row(self, column_name, position, task):
+        return (task['id'], column_name, position) + tuple(task.get(field) for field in TASK_FIELDS[1:])
+
+    def load(self):
+        columns = {}
+        for (name,) in self.connection.execute("SELECT name FROM columns ORDER BY position"):
+            columns[name] = []
+        (self.written,) = self.connection.execute("PRAGMA user_version").fetchone()
+
+        self.rows = {}
+        query = "SELECT id, column_name, position, description, timestamp, priority, deadline FROM tasks ORDER BY column_name, position"
+        for row in self.connection.execute(query):
+            task = {field: value for field, value in zip(TASK_FIELDS, row[:1] + row[3:]) if value is not None}
+            columns.setdefault(row[1], []).append(task)
+            self.rows[row[0]] = row
+        self.column_names = list(columns.keys())
+        # user_version is set on the first save, so a saved board without columns still loads
+        return columns if columns or self.written else None
+
+    def save(self, kanban):
+        rows = {}
+        for column_name, tasks in kanban.columns.items():
+            stored = {row[0]: row[2] for row in (self.rows.get(task['id']) for task in tasks)
+                      if row is not None and row[1] == column_name}
+            for position, task in zip(stable_positions(tasks, stored), tasks):
+                rows[task['id']] = self.task_row(column_name, position, task)
+
+        # Only write the rows that changed since the last save
+        changed = [row for task_id, row in rows.items() if self.rows.get(task_id) != row]
+        removed = [(task_id,) for task_id in self.rows if task_id not in rows]
+        column_names = list(kanban.columns.keys())
+
+        with self.connection:
+            if not self.written:
+                self.connection.execute("PRAGMA user_version = 1")
+            if column_names != self.column_names:
+                self.connection.execute("DELETE FROM columns")
+                self.connection.executemany("INSERT INTO columns (name, position) VALUES (?, ?)",
+                                            [(name, position) for position, name in enumerate(column_names)])
+            if removed:
+                self.connection.executemany("DELETE FROM tasks WHERE id = ?", removed)
+            if changed:
+                self.connection.executemany("INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?)", changed)
+
+        self.written = 1
+        self.column_names = column_names
+        self.rows = rows
+
+STORAGE_ENGINES = [JsonStorage, SqliteStorage]
+
+def apply_operation(columns, operation):
+    """
+    Applies one change operation from the backend's event stream to a board
+    (column name to tasks) and returns the resulting board.
+    """
+    def find(task_id):
+        for column_name, tasks in columns.items():
+            for i, task in enumerate(tasks):
+                if task['id'] == task_id:
+                    return column_name, i
+        return None, None
+
+    if operation['op'] == 'columns':
+        columns = {name: columns.get(name, []) for name in operation['columns']}
+    elif operation['op'] == 'remove':
+        column_name, i = find(operation['id'])
+        if column_name is not None:
+            del columns[column_name][i]
+    elif operation['op'] == 'task':
+        task = operation['task']
+        column_name, i = find(task['id'])
+        if column_name == operation['column']:
+            columns[column_name][i] = task
+        else:
+            if column_name is not None:
+                del columns[column_name][i]
+            columns.setdefault(operation['column'], []).append(task)
+    elif operation['op'] == 'order':
+        tasks = {task['id']: task for task in columns.get(operation['column'], [])}
+        columns[operation['column']] = [tasks[task_id] for task_id in operation['ids'] if task_id in tasks]
+    return columns
+
+def merge_boards(base, mine, theirs):
+    """
+    Three-way merge of boards (column name to tasks): the changes made in
+    mine since base are replayed on top of theirs. Without a base (None)
+    nothing counts as deleted, and tasks found in both boards are taken
+    from theirs.
+    """
+    def index(columns):
+        return {task['id']: (column_name, task) for column_name, tasks in columns.items() for task in tasks}
+
+    base_tasks = index(base or {})
+    theirs_tasks = index(theirs)
+    result = {name: list(tasks) for name, tasks in theirs.items()}
+
+    def remove(task_id):
+        for tasks in result.values():
+            tasks[:] = [task for task in tasks if task['id'] != task_id]
+
+    # Columns removed or added locally
+    for name in base or {}:
+        if name not in mine:
+            result.pop(name, None)
+    for name in mine:
+        if name not in result and (base is None or name not in base):
+            result[name] = []
+
+    # Tasks removed, added, edited or moved locally
+    for task_id in base_tasks:
+        if not any(task['id'] == task_id for tasks in mine.values() for task in tasks):
+            remove(task_id)
+    for task_id, (column_name, task) in index(mine).items():
+        if (base is None and task_id in theirs_tasks) or base_tasks.get(task_id) == (column_name, task):
+            continue
+        tasks = result.setdefault(column_name, [])
+        position = next((i for i, existing in enumerate(tasks) if existing['id'] == task_id), None)
+        if position is not None:
+            tasks[position] = task
+        else:
+            remove(task_id)
+            tasks.append(task)
+
+    return copy.deepcopy(result)
+
+def storage_engine(filename):
+    """
+    Picks the storage engine from the board's file extension, defaulting to JSON.
+    """
+    for engine in STORAGE_ENGINES:
+        if filename.lower().endswith(engine.extensions):
+            return engine
+    return JsonStorage
 
 class KanbanBoard:
     def __init__(self, filename="kanban.json"):
         self.columns = {}
         self.filename = filename  # Store the filename
+        self.storage = None
         self.output = []
         self.console = Console()  # Rich console instance
         self.remote = False
-        self.api_endpoint = ''
-        self.api_password = ''
+        self.api_endpoint = os.environ.get('KAPYBAN_API_ENDPOINT', '').rstrip('/')
+        self.api_password = os.environ.get('KAPYBAN_API_PASSWORD', '')
+        self.version = 0  # Last board version seen on the backend
+        self.synced = None  # The board as the backend has it at self.version
+        self.origin = uuid.uuid4().hex  # Tags our uploads, so their events can be recognised
+        self.on_remote_change = None  # Called after a remote update was merged
+        self.subscription = None  # Task following the backend's event stream
 
     def reset_output(self, params):
         self.output = []
@@ -38,7 +267,7 @@ class KanbanBoard:
             output = ('\n' * newline) + '-- ' + output
         self.output.append(output)
 
-    def print_output(self, latest=True, last_n_entries=10):
+    def print_output(self, latest=True, last_n_entries=10, should_print=True):
         print_string = ''
         if latest and self.output:
             print_string += "-- " + self.output[-1]
@@ -51,7 +280,10 @@ class KanbanBoard:
             for entry in self.output:
                 print_string += "\n-- " + entry
         print_string = print_string + '\n'
-        rprint(Panel(print_string, title='History'))
+        if should_print:
+            rprint(Panel(print_string, title='History'))
+        else:
+            return Panel(print_string, title='History')
 
     def create_column(self, column_name):
         # Add a new column to the board
@@ -400,7 +632,8 @@ class KanbanBoard:
     def show_board(self, should_print=True):
         table = Table(show_header=True, header_style="bold magenta", expand=True)
         for col_name in self.columns.keys():
-            table.add_column(col_name, justify="left", style="dim")
+            # Equal fixed widths keep the layout stable as tasks move between columns
+            table.add_column(col_name, justify="left", style="dim", ratio=1)
 
         # Sort tasks first by priority and then by timestamp
         sorted_columns = {
@@ -485,45 +718,178 @@ class KanbanBoard:
     def decode_unicode_escapes(self, s):
         return s.encode('latin1').decode('unicode_escape')
 
-    async def save_to_json(self, params='', add_output=True):
-        # Save the current state of the Kanban board to the specified JSON file
+    def to_json_string(self):
         board_data = {
                 "data": self.columns,
                 "remote": self.remote,
                 "board_visual": self.generate_html_table()
                 }
+        return self.decode_unicode_escapes(json.dumps(board_data, indent=4))
 
-        filename = self.filename
-        if not filename.lower().endswith('.json'):
-            filename += '.json'
-
-        # Convert board_data to a JSON string
-        json_string = self.decode_unicode_escapes(json.dumps(board_data, indent=4))
+    async def save_to_json(self, params='', add_output=True):
+        # Save the current state of the Kanban board through its storage engine
+        engine = storage_engine(self.filename)
+        if not isinstance(self.storage, engine) or self.storage.filename != engine.path(self.filename):
+            self.storage = engine(self.filename)
 
-        # Write the JSON string to a file
-        with open(filename, 'w') as file:
-            file.write(json_string)
+        self.storage.save(self)
 
         if self.api_endpoint:
-            url = f"{self.api_endpoint}/upload/{filename}"
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data={'password': self.api_password}, files={'file': open(filename, 'rb')}) as response:
-                    if response.status == 200:
-                        self.add_to_output("File successfully uploaded")
-                    else:
-                        self.add_to_output(f"Failed to upload file: {await response.text()}")
+            await self.upload()
+
+    async def upload(self, attempts=3):
+        # The backend always receives the board as JSON, whatever the local engine
+        filename = self.remote_filename()
+        url = f"{self.api_endpoint}/upload/{filename}"
+        for _ in range(attempts):
+            uploaded = copy.deepcopy(self.columns)
+            form = aiohttp.FormData()
+            form.add_field('password', self.api_password)
+            form.add_field('origin', self.origin)
+            # The Python backend rejects uploads that are not based on its latest version
+            form.add_field('base_version', str(self.version))
+            form.add_field('file', self.to_json_string(), filename=filename, content_type='application/json')
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.post(url, data=form) as response:
+                        # Only the Python backend replies with JSON
+                        body = await response.json() if response.content_type == 'application/json' else {}
+                        if response.status == 409:
+                            self.merge_remote(body.get('version', 0), body.get('data', {}))
+                            self.add_to_output(f"Merged changes from the server (version {self.version}).")
+                            continue  # Upload the merged board
+                        if response.status == 200:
+                            version = body.get('version', 0)
+                            if version >= self.version:
+                                self.version = version
+                                self.synced = uploaded
+                            self.add_to_output("File successfully uploaded")
+                        else:
+                            self.add_to_output(f"Failed to upload file: {await response.text()}")
+            except aiohttp.ClientError as e:
+                self.add_to_output(f"Failed to upload file: {e}")
+            return
+        self.add_to_output("Failed to upload file: the board kept changing on the server.")
 
+    def remote_filename(self):
+        filename = self.storage.filename if self.storage else self.filename
+        return os.path.splitext(os.path.basename(filename))[0] + '.json'
+
+    async def subscribe(self, retry_delay=5, max_retry_delay=300):
+        """
+        Follows the backend's event stream for this board and merges remote
+        changes into the in-memory board. Reconnects with the last seen
+        version, so only the missed changes are sent again.
+        """
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=None)
+        delay = retry_delay
+        while True:
+            url = f"{self.api_endpoint}/events/{self.remote_filename()}"
+            headers = {'Last-Event-ID': str(self.version)} if self.version else {}
+            try:
+                async with aiohttp.ClientSession(timeout=timeout) as session:
+                    async with session.get(url, headers=headers) as response:
+                        if response.status != 200 or response.content_type != 'text/event-stream':
+                            # Backends without an event stream answer with an error page
+                            self.add_to_output(f"Live updates unavailable: {self.api_endpoint} has no event stream.")
+                            return
+                        delay = retry_delay
+                        async for event, version, data in self.read_events(response):
+                            try:
+                                self.apply_remote_event(event, version, json.loads(data))
+                            except (ValueError, KeyError, TypeError, AttributeError, IndexError):
+                                # The board is only replaced once an event was applied in full
+                                self.add_to_output(f"Ignored malformed remote update (version {version}).")
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_retry_delay)
+
+    async def read_events(self, response):
+        """
+        Yields (event, version, data) for every event in a server-sent events
+        response. Chunks are split into lines here, as a snapshot of a large
+        board does not fit in aiohttp's line buffer.
+        """
+        pending = []  # Pieces of a line that has not ended yet
+        event, version, data = 'message', None, []
+        async for chunk in response.content.iter_any():
+            lines = chunk.split(b'\n')
+            if len(lines) == 1:
+                pending.append(chunk)
+                continue
+            lines[0] = b''.join(pending) + lines[0]
+            pending = [lines.pop()]
+            for line in lines:
+                line = line.decode('utf-8').rstrip('\r')
+                if not line:
+                    if data and version is not None:
+                        yield event, version, '\n'.join(data)
+                    event, version, data = 'message', None, []
+                elif line.startswith(':'):
+                    continue  # Keep-alive comment
+                else:
+                    field, _, value = line.partition(':')
+                    value = value[1:] if value.startswith(' ') else value
+                    if field == 'event':
+                        event = value
+                    elif field == 'id' and value.isdigit():
+                        version = int(value)
+                    elif field == 'data':
+                        data.append(value)
+
+    def subscription_stopped(self, task):
+        if not task.cancelled() and task.exception() is not None:
+            self.add_to_output(f"Live updates stopped: {task.exception()!r}")
+            if self.on_remote_change:
+                self.on_remote_change()
+
+    def apply_remote_event(self, event, version, data):
+        if event == 'snapshot':
+            # Version 0 means the backend has seen no uploads since it started,
+            # and a snapshot at our own version is the board we uploaded last
+            if not version or version == self.version:
+                self.version = version
+                return
+            theirs = data['data']
+            if not all(isinstance(tasks, list) for tasks in theirs.values()):
+                raise ValueError("Invalid board in snapshot")
+        elif event == 'change':
+            if version <= self.version:
+                return  # Already applied
+            theirs = copy.deepcopy(self.synced if self.synced is not None else self.columns)
+            for operation in data['operations']:
+                theirs = apply_operation(theirs, operation)
+            if data.get('origin') == self.origin:
+                # The echo of our own upload, which the board already contains
+                self.synced = theirs
+                self.version = version
+                return
+        else:
+            return
+
+        self.merge_remote(version, theirs)
+        self.add_to_output(f"Board updated remotely (version {version}).")
+        if self.on_remote_change:
+            self.on_remote_change()
+
+    def merge_remote(self, version, theirs):
+        # Keep local changes the backend has not accepted yet on top of its board
+        self.columns = merge_boards(self.synced, self.columns, theirs)
+        self.synced = copy.deepcopy(theirs)
+        self.version = version
+        if self.storage:
+            self.storage.save(self)
 
     def load_from_json(self, filename="kanban.json"):
-        # Load the Kanban board from a JSON file
-        if not filename.lower().endswith('.json'):
-            filename += '.json'
-        try:
-            with open(filename, 'r') as file:
-                loaded_data = json.load(file)
-                self.columns = loaded_data.get("data", {})  # Default to empty dict if "data" key is not found
-                self.add_to_output(f"Kanban board loaded from {filename}.")
-        except FileNotFoundError:
+        # Load the Kanban board through the storage engine matching the filename
+        self.storage = storage_engine(filename)(filename)
+        filename = self.storage.filename
+        columns = self.storage.load()
+        if columns is not None:
+            self.columns = columns
+            self.add_to_output(f"Kanban board loaded from {filename}.")
+        else:
             self.add_to_output(f"No existing {filename} found. Starting with a new board.")
 
 
@@ -534,7 +900,7 @@ class KanbanBoard:
 
         General:
         - help: Displays this help message.
-        - save: Saves the current state of the board to .json.
+        - save: Saves the current state of the board to .json (or .db when using SQLite).
         - exit: Exits the application.
 
         Board Management:
@@ -556,9 +922,116 @@ class KanbanBoard:
         """
         self.add_to_output(help_message)
 
-def clear_screen():
-    """Clears the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+
+class ScreenRenderer:
+    """
+    Draws the board and history as full-screen frames. Only the lines that
+    differ from the previous frame are rewritten, using escape sequences
+    instead of clearing the screen through a shell.
+    """
+    prompt_lines = 3  # Blank line, prompt and the entered command below the frame
+
+    def __init__(self, console):
+        self.console = console
+        self.lines = None  # Lines currently on screen, None when unknown
+        self.size = None
+
+    def capture(self, renderable):
+        with self.console.capture() as capture:
+            self.console.print(renderable)
+        return capture.get().splitlines()
+
+    def layout(self, board, history, entries, height):
+        """
+        Fits the board and as many of the latest history entries as there is
+        room for into exactly height lines. The history is anchored to the
+        bottom, so the lines above it do not shift when the board grows or
+        shrinks. Returns None if the board and one entry do not fit.
+        """
+        for count in range(entries, 0, -1):
+            footer = self.capture(history(count))
+            if len(board) + len(footer) <= height:
+                # Padding keeps the prompt on the same row below the frame
+                return board + [''] * (height - len(board) - len(footer)) + footer
+        return None
+
+    def render(self, board, history, entries=10, keep_cursor=False):
+        """
+        Draws the board above the history, where history(n) returns the
+        panel with the last n entries. With keep_cursor the frame is drawn
+        without touching the prompt below it, e.g. when the board changes
+        while the user is typing a command.
+        """
+        if not self.console.is_terminal or self.console.legacy_windows:
+            if keep_cursor:
+                return  # Reprinting would scroll the prompt away
+            # No cursor addressing available, fall back to clear and reprint
+            self.console.clear()
+            self.console.print(board)
+            self.console.print(history(entries))
+            return
+
+        size = (self.console.width, self.console.height)
+        if keep_cursor and (self.lines is None or size != self.size):
+            return  # The prompt's row is unknown, wait for the next full frame
+        height = max(size[1] - self.prompt_lines, 1)
+        board_lines = self.capture(board)
+        lines = self.layout(board_lines, history, entries, height)
+
+        if size != self.size:
+            self.size = size
+            self.lines = None
+
+        if lines is None:
+            if keep_cursor:
+                return
+            # Too tall for the terminal: reprint in full and leave the top in the scrollback
+            lines = board_lines + self.capture(history(entries))
+            output = ['\x1b[2J\x1b[H' + '\n'.join(lines) + '\n\x1b[J']
+            self.lines = None
+        elif self.lines is None and not keep_cursor:
+            output = ['\x1b[2J\x1b[H' + '\n'.join(lines) + '\n\x1b[J']
+            self.lines = lines
+        else:
+            previous = self.lines or []
+            output = [f"\x1b[{row + 1};1H{line}\x1b[K" for row, line in enumerate(lines)
+                      if row >= len(previous) or previous[row] != line]
+            if keep_cursor:
+                output = ['\x1b7'] + output + ['\x1b8']  # Save and restore the cursor
+            else:
+                # Clear the previous prompt below the frame
+                output.append(f"\x1b[{height + 1};1H\x1b[J")
+            self.lines = lines
+
+        self.console.file.write(''.join(output))
+        self.console.file.flush()
+
+async def ask_in_background(prompt):
+    """
+    Asks for a line of input without blocking the event loop, so remote
+    updates are merged while waiting. On a terminal the loop watches stdin
+    itself instead of using a thread, so Ctrl-C exits right away.
+    """
+    loop = asyncio.get_running_loop()
+    if not sys.stdin.isatty():
+        return await asyncio.to_thread(Prompt.ask, prompt)
+    readable = loop.create_future()
+    try:
+        loop.add_reader(sys.stdin.fileno(), lambda: readable.done() or readable.set_result(None))
+    except NotImplementedError:
+        # Event loops on Windows cannot watch stdin
+        return await asyncio.to_thread(Prompt.ask, prompt)
+
+    try:
+        rprint(prompt + ': ', end='')
+        await readable
+    finally:
+        loop.remove_reader(sys.stdin.fileno())
+    # A terminal only becomes readable once a whole line was entered
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
 
 async def parse_and_execute_command(kanban, command_str):
     commands = {
@@ -599,33 +1072,45 @@ async def parse_and_execute_command(kanban, command_str):
 
 async def main():
     kanban = KanbanBoard()
-    clear_screen()  # Clear the screen after command execution
+    screen = ScreenRenderer(kanban.console)
 
     # Check if a filename is provided as a command-line argument
     if len(sys.argv) > 1:
         filename = sys.argv[1]
         kanban.load_from_json(filename)
         kanban.filename = filename
-        kanban.show_board()
-        kanban.print_output(False, 2)  # Print the output of the command
 
     else:
         # Prompt the user to enter a filename if not provided
         filename_input = Prompt.ask("Enter a name for your new Kanban board: ", default="Kanban")
-        filename = filename_input if filename_input.lower().endswith('.json') else filename_input + '.json'
+        filename = storage_engine(filename_input).path(filename_input)
 
         if os.path.isfile(filename):
             kanban.load_from_json(filename)
-            kanban.show_board()  # Show the board
         else:
             kanban.filename = filename
 
+    # Draw the first frame, which also fixes the prompt's row for later redraws
+    def history(entries):
+        return kanban.print_output(False, entries, False)
+
+    screen.render(kanban.show_board(False), history, 2)
+
+    if kanban.api_endpoint:
+        # Redraw remote updates right away, above the prompt the user may be typing in
+        kanban.on_remote_change = lambda: screen.render(kanban.show_board(False), history, keep_cursor=True)
+        kanban.subscription = asyncio.create_task(kanban.subscribe())
+        kanban.subscription.add_done_callback(kanban.subscription_stopped)
+
     while True:
-        command_str = Prompt.ask("\nEnter command")
+        if kanban.api_endpoint:
+            # Remote updates are merged while waiting for input
+            command_str = await ask_in_background("\nEnter command")
+        else:
+            command_str = Prompt.ask("\nEnter command")
         await parse_and_execute_command(kanban, command_str)
-        clear_screen()  # Clear the screen after command execution
-        kanban.show_board()  # Show the board
-        kanban.print_output(False, 10)  # Print the output of the command
+        # Redraw only what the command changed on screen
+        screen.render(kanban.show_board(False), history)
 
 if __name__ == "__main__":
     asyncio.run(main())